@@ -5,39 +5,54 @@ Single hook = faster execution, no duplication risk.
 """
 
 import json
+import os
+import time
 import sys
 import re
-import logging
 from pathlib import Path
 
-# Setup logging
+# Lightweight logger: one O_APPEND fd opened at import, one os.write per
+# record. O_APPEND writes are atomic up to PIPE_BUF so no locking is
+# needed, and the logging module's handler/formatter/lock machinery
+# stays off the hot path entirely.
 LOG_DIR = Path.home() / ".claude" / "hooks" / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
-logging.basicConfig(
-    filename=LOG_DIR / "bash-safety-gate.log",
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+_LOG_FD = os.open(str(LOG_DIR / "bash-safety-gate.log"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _log(level: str, msg: str) -> None:
+    try:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        os.write(_LOG_FD, f"{timestamp} - {level} - {msg}\n".encode("utf-8", "replace"))
+    except OSError:
+        pass
+
 
 # === DANGEROUS COMMAND PATTERNS ===
+# Gap-fillers use negated character classes ([^;&]*, [^;|&]*) instead
+# of unbounded .* so a crafted long command cannot trigger catastrophic
+# backtracking. The download-pipe and dd gaps deliberately cross pipes
+# (curl url | tee log | sh is still a pipe-to-shell) but stop at ;/&
+# so a match never spans into a separate command.
+# Ordered cheapest-rejection first: fixed literal prefixes before
+# patterns with quantified gaps, so alternatives that fail, fail fast.
 BLOCK_PATTERNS = [
-    (r"rm\s+-rf\s+[/~]", "Recursive delete of root/home"),
-    (r"rm\s+-rf\s+\.\s*$", "Recursive delete of current dir"),
     (r":(){ :|:& };:", "Fork bomb"),
     (r"mkfs\.", "Format filesystem"),
-    (r"dd\s+if=.*of=/dev/", "Overwrite disk"),
+    (r"chmod\s+-r\s+777\s+/", "Dangerous permissions on root"),
     (r">\s*/dev/sd[a-z]", "Redirect to disk device"),
-    (r"chmod\s+-R\s+777\s+/", "Dangerous permissions on root"),
-    (r"curl.*\|\s*(ba)?sh", "Pipe curl to shell"),
-    (r"wget.*\|\s*(ba)?sh", "Pipe wget to shell"),
+    (r"rm\s+-rf\s+[/~]", "Recursive delete of root/home"),
+    (r"rm\s+-rf\s+\.\s*$", "Recursive delete of current dir"),
+    (r"dd\s+if=[^;&]*of=/dev/", "Overwrite disk"),
+    (r"curl[^;&]*\|\s*(?:ba)?sh", "Pipe curl to shell"),
+    (r"wget[^;&]*\|\s*(?:ba)?sh", "Pipe wget to shell"),
 ]
 
 # === GIT SAFETY PATTERNS ===
 GIT_DANGEROUS = [
-    (r"git\s+push\s+.*--force\s+.*(?:main|master)", "Force push to main/master"),
-    (r"git\s+push\s+-f\s+.*(?:main|master)", "Force push to main/master"),
-    (r"git\s+reset\s+--hard\s+HEAD~?\d*\s*$", "Hard reset (may lose work)"),
+    (r"git\s+push\s+[^;|&]*--force\s+[^;|&]*(?:main|master)", "Force push to main/master"),
+    (r"git\s+push\s+-f\s+[^;|&]*(?:main|master)", "Force push to main/master"),
+    (r"git\s+reset\s+--hard\s+head~?\d*\s*$", "Hard reset (may lose work)"),
     (r"git\s+clean\s+-fd", "Clean untracked files"),
     (r"git\s+checkout\s+--\s+\.", "Discard all changes"),
 ]
@@ -48,6 +63,36 @@ GIT_WARN_PATTERNS = [
 ]
 
 
+def _fuse(patterns: list[tuple[str, str]], prefix: str) -> tuple[re.Pattern, dict[str, str]]:
+    """
+    Fuse a pattern list into one alternation regex with named groups.
+
+    A single compiled alternation scans the command once instead of once
+    per pattern; the matched group name maps back to the description.
+    Patterns must use non-capturing groups only, so match.lastgroup
+    always names the alternative that matched.
+
+    Callers match against the lowered command with no IGNORECASE flag,
+    so the engine skips per-character case folding - pattern sources
+    MUST be all lowercase, or they can never match.
+    """
+    fused = re.compile(
+        "|".join(f"(?P<{prefix}{i}>{p})" for i, (p, _) in enumerate(patterns))
+    )
+    descriptions = {f"{prefix}{i}": desc for i, (_, desc) in enumerate(patterns)}
+    return fused, descriptions
+
+
+_BLOCK_RE, _BLOCK_DESC = _fuse(BLOCK_PATTERNS, "b")
+_GIT_DANGEROUS_RE, _GIT_DANGEROUS_DESC = _fuse(GIT_DANGEROUS, "g")
+_GIT_WARN_RE, _GIT_WARN_DESC = _fuse(GIT_WARN_PATTERNS, "w")
+
+# Fast prescreen: every pattern above requires one of these literal
+# substrings, and str.__contains__ is far cheaper than the regex engine.
+# Most commands are benign and never reach the regex pass at all.
+_REQUIRED_LITERALS = ("rm", "mkfs", "dd", "/dev/", "chmod", "curl", "wget", ":(", "git")
+
+
 def check_command(command: str) -> tuple[str, str, str]:
     """
     Check command for safety issues.
@@ -56,20 +101,24 @@ def check_command(command: str) -> tuple[str, str, str]:
     """
     cmd_lower = command.lower()
 
+    # Cheap literal prescreen - skip the regex pass for benign commands
+    if not any(literal in cmd_lower for literal in _REQUIRED_LITERALS):
+        return "allow", "", ""
+
     # Check dangerous patterns (BLOCK)
-    for pattern, desc in BLOCK_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return "deny", f"Blocked dangerous command: {desc}", ""
+    match = _BLOCK_RE.search(cmd_lower)
+    if match:
+        return "deny", f"Blocked dangerous command: {_BLOCK_DESC[match.lastgroup]}", ""
 
     # Check git dangerous patterns (BLOCK)
-    for pattern, desc in GIT_DANGEROUS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return "deny", f"Blocked git operation: {desc}", ""
+    match = _GIT_DANGEROUS_RE.search(cmd_lower)
+    if match:
+        return "deny", f"Blocked git operation: {_GIT_DANGEROUS_DESC[match.lastgroup]}", ""
 
     # Check git warning patterns (ALLOW with context)
-    for pattern, desc in GIT_WARN_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return "allow", "", f"⚠️ Caution: {desc} - ensure this is intentional"
+    match = _GIT_WARN_RE.search(cmd_lower)
+    if match:
+        return "allow", "", f"⚠️ Caution: {_GIT_WARN_DESC[match.lastgroup]} - ensure this is intentional"
 
     return "allow", "", ""
 
@@ -82,12 +131,12 @@ def main():
         if not command:
             sys.exit(0)
 
-        logger.info(f"Checking: {command[:100]}...")
+        _log("INFO", f"Checking: {command[:100]}...")
 
         decision, reason, context = check_command(command)
 
         if decision == "deny":
-            logger.warning(f"BLOCKED: {reason}")
+            _log("WARNING", f"BLOCKED: {reason}")
             print(json.dumps({
                 "hookSpecificOutput": {
                     "hookEventName": "PreToolUse",
@@ -97,7 +146,7 @@ def main():
             }))
         elif context:
             # Allow but add warning context
-            logger.info(f"Warning: {context}")
+            _log("INFO", f"Warning: {context}")
             print(json.dumps({
                 "hookSpecificOutput": {
                     "hookEventName": "PreToolUse",
@@ -108,7 +157,7 @@ def main():
         sys.exit(0)
 
     except Exception as e:
-        logger.error(f"Error: {e}")
+        _log("ERROR", f"Error: {e}")
         sys.exit(0)
 
 
@@ -7,21 +7,37 @@ Runs on PreCompact event.
 """
 
 import json
+import os
+import time
 import sys
-import logging
+import re
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
-# Setup logging
+try:
+    import orjson
+    _loads = orjson.loads  # C-backed, 2-5x faster; error subclasses json's
+except ImportError:
+    _loads = json.loads
+
+# Upper bound on stdin; compaction contexts are large but not unbounded
+_STDIN_CAP = 8 * 1024 * 1024
+
+# Lightweight logger: one O_APPEND fd opened at import, one os.write per
+# record. O_APPEND writes are atomic up to PIPE_BUF so no locking is
+# needed, and the logging module's handler/formatter/lock machinery
+# stays off the hot path entirely.
 LOG_DIR = Path.home() / ".claude" / "hooks" / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
-logging.basicConfig(
-    filename=LOG_DIR / "context-compression-guard.log",
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+_LOG_FD = os.open(str(LOG_DIR / "context-compression-guard.log"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _log(level: str, msg: str) -> None:
+    try:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        os.write(_LOG_FD, f"{timestamp} - {level} - {msg}\n".encode("utf-8", "replace"))
+    except OSError:
+        pass
 
 
 def get_memory_bank_path() -> Path:
@@ -29,6 +45,28 @@ def get_memory_bank_path() -> Path:
     return Path.home() / ".claude" / "memory-bank" / "main"
 
 
+# Single fused matcher for all importance markers. One named group per
+# bucket; the first marker found in a line selects its bucket. Path
+# indicators stay case-sensitive (no scoped (?i:) flag) to match the
+# original checks.
+_MARKERS = (
+    r"(?P<decisions>(?i:decision:|decided:|approved:|confirmed:|agreed:))"
+    r"|(?P<critical_items>(?i:critical:|important:|must:|never:|always:"
+    r"|security:|permission:|error:|bug:|issue:))"
+    r"|(?P<file_paths>[/\\]|\.py|\.js|\.ts|\.json|\.md)"
+    r"|(?P<commands>(?i:git |bash |npm |python |docker |commit))"
+)
+
+# Multiline form matched against the whole context: one C-level finditer
+# pass replaces the per-line Python loop (and the line-list allocation
+# from context.split). Each match spans a full line containing a marker.
+_IMPORTANT_RE = re.compile(rf"(?m)^.*?(?:{_MARKERS}).*$")
+
+# Only this many entries per bucket ever reach the archive, so stop
+# collecting (and scanning) once every bucket is full.
+_BUCKET_CAP = 10
+
+
 def extract_important_elements(context: str) -> Dict[str, List[str]]:
     """
     Extract potentially important elements from context.
@@ -47,35 +85,22 @@ def extract_important_elements(context: str) -> Dict[str, List[str]]:
     }
 
     try:
-        lines = context.split('\n')
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Look for decision markers
-            if any(marker in line_lower for marker in
-                   ['decision:', 'decided:', 'approved:', 'confirmed:', 'agreed:']):
-                important["decisions"].append(line.strip())
-
-            # Look for critical markers
-            if any(marker in line_lower for marker in
-                   ['critical:', 'important:', 'must:', 'never:', 'always:',
-                    'security:', 'permission:', 'error:', 'bug:', 'issue:']):
-                important["critical_items"].append(line.strip())
-
-            # Look for file paths (approximate)
-            if any(path_indicator in line for path_indicator in
-                   ['/', '\\', '.py', '.js', '.ts', '.json', '.md']):
-                if len(line.strip()) < 200:  # Reasonable length for a path reference
-                    important["file_paths"].append(line.strip())
-
-            # Look for commands (git, bash, etc)
-            if any(cmd in line_lower for cmd in
-                   ['git ', 'bash ', 'npm ', 'python ', 'docker ', 'commit']):
-                important["commands"].append(line.strip())
+        for match in _IMPORTANT_RE.finditer(context):
+            stripped = match.group(0).strip()
+            for bucket in important:
+                if match.group(bucket) is None:
+                    continue
+                if bucket == "file_paths" and len(stripped) >= 200:
+                    break  # Too long to be a path reference
+                if len(important[bucket]) < _BUCKET_CAP:
+                    important[bucket].append(stripped)
+                break
+
+            if all(len(entries) >= _BUCKET_CAP for entries in important.values()):
+                break  # Every bucket full - nothing more can be archived
 
     except Exception as e:
-        logger.error(f"Error extracting important elements: {type(e).__name__}: {e}")
+        _log("ERROR", f"Error extracting important elements: {type(e).__name__}: {e}")
 
     return important
 
@@ -114,6 +139,9 @@ def archive_critical_context(important_elements: Dict[str, List[str]]) -> Option
     Returns:
         Path to archive file, or None if error
     """
+    # Deferred: only the archive path (rare) pays the datetime import
+    from datetime import datetime
+
     try:
         memory_path = get_memory_bank_path()
         memory_path.mkdir(parents=True, exist_ok=True)
@@ -127,21 +155,21 @@ def archive_critical_context(important_elements: Dict[str, List[str]]) -> Option
         archive_data = {
             "timestamp": datetime.now().isoformat(),
             "archive_type": "pre-compression",
-            "critical_decisions": important_elements.get("decisions", [])[:10],
-            "critical_items": important_elements.get("critical_items", [])[:10],
-            "referenced_files": important_elements.get("file_paths", [])[:10],
-            "commands_used": important_elements.get("commands", [])[:10],
+            "critical_decisions": important_elements.get("decisions", [])[:_BUCKET_CAP],
+            "critical_items": important_elements.get("critical_items", [])[:_BUCKET_CAP],
+            "referenced_files": important_elements.get("file_paths", [])[:_BUCKET_CAP],
+            "commands_used": important_elements.get("commands", [])[:_BUCKET_CAP],
             "note": "This context was archived before compression to preserve important decisions and context"
         }
 
         with open(archive_file, 'w', encoding='utf-8') as f:
             json.dump(archive_data, f, indent=2, ensure_ascii=False)
 
-        logger.info(f"Critical context archived to: {archive_file}")
+        _log("INFO", f"Critical context archived to: {archive_file}")
         return str(archive_file)
 
     except Exception as e:
-        logger.error(f"Error archiving critical context: {type(e).__name__}: {e}")
+        _log("ERROR", f"Error archiving critical context: {type(e).__name__}: {e}")
         return None
 
 
@@ -197,7 +225,7 @@ def build_warning_message(context: str, impact: Dict[str, Any],
 def main() -> None:
     """Main hook entry point."""
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read(_STDIN_CAP))
 
         # Extract context that will be compressed
         context = input_data.get("context", "")
@@ -211,12 +239,13 @@ def main() -> None:
         # Calculate compression impact
         impact = calculate_compression_impact(input_data)
 
-        # Archive critical context if there's anything important
-        has_important = any(important_elements.get(key) for key in important_elements)
+        # Archive critical context if there's anything important;
+        # otherwise skip the archive path entirely (mkdir + file write)
+        has_important = any(important_elements.values())
         if has_important:
             archive_path = archive_critical_context(important_elements)
             if archive_path:
-                logger.info(f"Context archived before compression to {archive_path}")
+                _log("INFO", f"Context archived before compression to {archive_path}")
 
         # Build warning message
         warning_message = build_warning_message(context, impact, important_elements)
@@ -225,14 +254,14 @@ def main() -> None:
         # No hookSpecificOutput needed - just print informational message
         print(warning_message)
 
-        logger.info(f"Compression event logged - {impact['reduction_percent']:.1f}% reduction")
+        _log("INFO", f"Compression event logged - {impact['reduction_percent']:.1f}% reduction")
         sys.exit(0)
 
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
+        _log("ERROR", f"JSON decode error: {e}")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
+        _log("ERROR", f"Unexpected error: {type(e).__name__}: {e}")
         sys.exit(0)
 
 
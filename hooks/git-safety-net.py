@@ -5,21 +5,39 @@ Prevents dangerous git operations and protects important branches.
 Runs on PreToolUse for Write|Edit|MultiEdit operations.
 """
 
+import fnmatch
 import json
+import os
+import time
+import re
 import sys
-import logging
-import subprocess
 from pathlib import Path
 
-# Setup logging
+try:
+    import orjson
+    _loads = orjson.loads  # C-backed, 2-5x faster; error subclasses json's
+except ImportError:
+    _loads = json.loads
+
+# Upper bound on stdin; Write payloads carry file content but not unbounded
+_STDIN_CAP = 8 * 1024 * 1024
+
+# Lightweight logger: one O_APPEND fd opened at import, one os.write per
+# record. O_APPEND writes are atomic up to PIPE_BUF so no locking is
+# needed, and the logging module's handler/formatter/lock machinery
+# stays off the hot path entirely.
 LOG_DIR = Path.home() / ".claude" / "hooks" / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
-logging.basicConfig(
-    filename=LOG_DIR / "git-safety-net.log",
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+_LOG_FD = os.open(str(LOG_DIR / "git-safety-net.log"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _log(level: str, msg: str) -> None:
+    try:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        os.write(_LOG_FD, f"{timestamp} - {level} - {msg}\n".encode("utf-8", "replace"))
+    except OSError:
+        pass
+
 
 # Protected branches that require extra caution
 PROTECTED_BRANCHES = ["main", "master", "production", "release"]
@@ -35,37 +53,68 @@ PROTECTED_PATTERNS = [
     "id_rsa*",
 ]
 
+# One alternation compiled at import; fnmatch.fnmatch would re-translate
+# and re-compile every pattern on every call. fnmatch normcases both
+# sides, which folds case on Windows - the platform this config deploys
+# to - so mirror that with IGNORECASE wherever normcase folds, keeping
+# .ENV or SECRETS.pem blocked on case-insensitive filesystems.
+_PROTECTED_RE = re.compile(
+    "|".join(fnmatch.translate(p) for p in PROTECTED_PATTERNS),
+    re.IGNORECASE if os.path.normcase("A") == "a" else 0,
+)
+
+
+def _read_head(git_path: str) -> str | None:
+    """Read the branch name from a .git directory's HEAD file.
+
+    Deliberately uncached: the read costs ~50us, and a cache would keep
+    reporting a stale branch after a checkout in a long-lived process.
+    """
+    git = Path(git_path)
+    if git.is_file():
+        # Worktree/submodule: .git is a pointer file to the real git dir
+        pointer = git.read_text(encoding="utf-8").strip()
+        if not pointer.startswith("gitdir:"):
+            return None
+        target = Path(pointer[len("gitdir:"):].strip())
+        if not target.is_absolute():
+            # Relative pointers (submodules) resolve against the
+            # directory holding the .git file, not the process cwd
+            target = git.parent / target
+        git = target
+    head = (git / "HEAD").read_text(encoding="utf-8").strip()
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return "HEAD"  # Detached, matches rev-parse --abbrev-ref
+
 
 def get_current_branch() -> str | None:
-    """Get current git branch."""
+    """
+    Get current git branch by reading .git/HEAD directly.
+
+    A single small file read (~50us) instead of forking a git
+    subprocess (~15-30ms) on every Write/Edit operation.
+    """
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        for parent in [Path.cwd(), *Path.cwd().parents]:
+            git_path = parent / ".git"
+            if git_path.exists():
+                return _read_head(str(git_path))
     except Exception as e:
-        logger.debug(f"Error getting branch: {e}")
+        _log("DEBUG", f"Error getting branch: {e}")
     return None
 
 
 def is_protected_file(file_path: str) -> bool:
     """Check if file matches protected patterns."""
-    from fnmatch import fnmatch
     file_name = Path(file_path).name
-    for pattern in PROTECTED_PATTERNS:
-        if fnmatch(file_name, pattern) or fnmatch(file_path, pattern):
-            return True
-    return False
+    return bool(_PROTECTED_RE.match(file_name)) or bool(_PROTECTED_RE.match(file_path))
 
 
 def main() -> None:
     """Main hook entry point."""
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read(_STDIN_CAP))
         tool_name = input_data.get("tool_name", "")
         tool_input = input_data.get("tool_input", {})
 
@@ -81,23 +130,23 @@ def main() -> None:
                 }
             }
             print(json.dumps(output))
-            logger.warning(f"Blocked access to protected file: {file_path}")
+            _log("WARNING", f"Blocked access to protected file: {file_path}")
             sys.exit(0)
 
         # Check branch protection for certain operations
         branch = get_current_branch()
         if branch in PROTECTED_BRANCHES:
-            logger.info(f"Operating on protected branch: {branch}")
+            _log("INFO", f"Operating on protected branch: {branch}")
             # We don't block, just log for awareness
 
         # Allow the operation
         sys.exit(0)
 
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
+        _log("ERROR", f"JSON decode error: {e}")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
+        _log("ERROR", f"Unexpected error: {type(e).__name__}: {e}")
         sys.exit(0)
 
 
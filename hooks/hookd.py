@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Hook Daemon for Claude Code.
+Keeps the hook modules imported in one long-lived process so each hook
+invocation skips CPython cold-start and module imports (~30-80ms), which
+dominate the actual work the hooks do.
+
+Usage:
+    python hookd.py serve            # Start the daemon (blocks)
+    python hookd.py call <hook>      # Forward stdin JSON to the daemon
+
+To route a hook through the daemon, change its command in settings.json
+from `python .../bash-safety-gate.py` to
+`python .../hookd.py call bash-safety-gate`. The client falls back to
+running the hook script directly when the daemon is not up, so the
+daemon is strictly opt-in.
+"""
+
+import io
+import importlib.util
+import json
+import os
+import socket
+import subprocess
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+
+HOOKS_DIR = Path(__file__).resolve().parent
+SOCKET_PATH = Path.home() / ".claude" / "hookd.sock"
+
+# Hook scripts served by the daemon, keyed by the name clients pass
+HOOKS = {
+    "bash-safety-gate": "bash-safety-gate.py",
+    "safety-gate": "safety-gate.py",
+    "quality-gate": "quality-gate.py",
+    "git-safety-net": "git-safety-net.py",
+    "post-edit-format": "post-edit-format.py",
+    "prompt-context-injector": "prompt-context-injector.py",
+    "context-compression-guard": "context-compression-guard.py",
+}
+
+_modules: dict = {}
+
+
+def _load_hook(name: str):
+    """Import a hook module once and cache it (filenames are hyphenated)."""
+    module = _modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            name.replace("-", "_"), HOOKS_DIR / HOOKS[name]
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[name] = module
+    return module
+
+
+def _dispatch(name: str, payload: str) -> str:
+    """Run a hook's main() against payload, returning its stdout."""
+    module = _load_hook(name)
+
+    # Hooks resolve the repo from their cwd; honor the session's cwd
+    try:
+        cwd = json.loads(payload).get("cwd", "")
+        if cwd and os.path.isdir(cwd):
+            os.chdir(cwd)
+    except (ValueError, AttributeError):
+        pass
+
+    stdout = io.StringIO()
+    original_stdin = sys.stdin
+    # TextIOWrapper over BytesIO, not StringIO: hooks that read binary
+    # stdin via sys.stdin.buffer need a real buffer underneath
+    sys.stdin = io.TextIOWrapper(io.BytesIO(payload.encode("utf-8")), encoding="utf-8")
+    try:
+        with redirect_stdout(stdout):
+            try:
+                module.main()
+            except SystemExit:
+                pass  # Hooks exit 0 after printing their JSON response
+    finally:
+        sys.stdin = original_stdin
+    return stdout.getvalue()
+
+
+def serve() -> None:
+    """Accept hook requests on a Unix socket until killed."""
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(SOCKET_PATH))
+        os.chmod(SOCKET_PATH, 0o600)
+        server.listen()
+
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                chunks = []
+                while chunk := conn.recv(65536):
+                    chunks.append(chunk)
+                try:
+                    request = json.loads(b"".join(chunks))
+                    response = _dispatch(request["hook"], request.get("payload", ""))
+                except Exception as e:
+                    response = ""
+                    print(f"hookd: {type(e).__name__}: {e}", file=sys.stderr)
+                conn.sendall(response.encode("utf-8"))
+
+
+def call(name: str) -> int:
+    """Forward stdin to the daemon; fall back to running the script."""
+    if name not in HOOKS:
+        print(f"hookd: unknown hook '{name}'", file=sys.stderr)
+        return 1
+
+    payload = sys.stdin.read()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(SOCKET_PATH))
+            client.sendall(json.dumps({"hook": name, "payload": payload}).encode("utf-8"))
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := client.recv(65536):
+                chunks.append(chunk)
+        sys.stdout.write(b"".join(chunks).decode("utf-8"))
+        return 0
+    except OSError:
+        # Daemon not running - run the hook script directly
+        result = subprocess.run(
+            [sys.executable, str(HOOKS_DIR / HOOKS[name])],
+            input=payload, capture_output=True, text=True
+        )
+        sys.stdout.write(result.stdout)
+        return result.returncode
+
+
+def main() -> int:
+    if len(sys.argv) >= 2 and sys.argv[1] == "serve":
+        serve()
+        return 0
+    if len(sys.argv) >= 3 and sys.argv[1] == "call":
+        return call(sys.argv[2])
+    print(__doc__.strip(), file=sys.stderr)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
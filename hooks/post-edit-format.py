@@ -6,35 +6,120 @@ Runs on PostToolUse for Write|Edit|MultiEdit operations.
 """
 
 import json
+import os
+import time
+import shutil
 import sys
-import logging
-import subprocess
 from pathlib import Path
 
-# Setup logging
+try:
+    import orjson
+    _loads = orjson.loads  # C-backed, 2-5x faster; error subclasses json's
+except ImportError:
+    _loads = json.loads
+
+# Upper bound on stdin; Write payloads carry file content but not unbounded
+_STDIN_CAP = 8 * 1024 * 1024
+
+# Lightweight logger: one O_APPEND fd opened at import, one os.write per
+# record. O_APPEND writes are atomic up to PIPE_BUF so no locking is
+# needed, and the logging module's handler/formatter/lock machinery
+# stays off the hot path entirely.
 LOG_DIR = Path.home() / ".claude" / "hooks" / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
-logging.basicConfig(
-    filename=LOG_DIR / "post-edit-format.log",
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
+_LOG_FD = os.open(str(LOG_DIR / "post-edit-format.log"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _log(level: str, msg: str) -> None:
+    try:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        os.write(_LOG_FD, f"{timestamp} - {level} - {msg}\n".encode("utf-8", "replace"))
+    except OSError:
+        pass
+
+
+# Resolve prettier once at import: a binary already on PATH skips the
+# npx resolver, which costs several hundred ms per invocation.
+_PRETTIER_BIN = shutil.which("prettier")
+_PRETTIER_CMD = [_PRETTIER_BIN, "--write"] if _PRETTIER_BIN else ["npx", "prettier", "--write"]
+
+# Point this at a running blackd (e.g. http://127.0.0.1:45484) to format
+# Python over HTTP instead of paying black's subprocess startup per edit
+_BLACKD_URL = os.environ.get("CLAUDE_BLACKD_URL", "")
 
 # Formatters by file extension
 FORMATTERS = {
     ".py": ["python", "-m", "black", "--quiet"],
-    ".js": ["npx", "prettier", "--write"],
-    ".ts": ["npx", "prettier", "--write"],
-    ".tsx": ["npx", "prettier", "--write"],
-    ".jsx": ["npx", "prettier", "--write"],
-    ".json": ["npx", "prettier", "--write"],
-    ".md": ["npx", "prettier", "--write"],
-    ".yaml": ["npx", "prettier", "--write"],
-    ".yml": ["npx", "prettier", "--write"],
+    ".js": _PRETTIER_CMD,
+    ".ts": _PRETTIER_CMD,
+    ".tsx": _PRETTIER_CMD,
+    ".jsx": _PRETTIER_CMD,
+    ".json": _PRETTIER_CMD,
+    ".md": _PRETTIER_CMD,
+    ".yaml": _PRETTIER_CMD,
+    ".yml": _PRETTIER_CMD,
 }
 
 
+# Cache of already-formatted files, keyed by path with (mtime_ns, size).
+# A hit means the file is untouched since its last format - skip the
+# formatter subprocess entirely.
+_STATE_DIR = Path.home() / ".claude" / "hooks" / "state"
+_FORMAT_CACHE = _STATE_DIR / "formatted.json"
+
+
+def _load_format_cache() -> dict:
+    try:
+        with open(_FORMAT_CACHE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _record_formatted(path: Path) -> None:
+    """Remember the post-format stat so unchanged files skip formatting."""
+    try:
+        stat = path.stat()
+        cache = _load_format_cache()
+        cache[str(path)] = [stat.st_mtime_ns, stat.st_size]
+        _STATE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_FORMAT_CACHE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        _log("DEBUG", f"Could not update format cache: {e}")
+
+
+def _format_with_blackd(path: Path) -> bool | None:
+    """
+    Format a Python file via a running blackd daemon.
+
+    Returns:
+        True/False on success/failure, or None when blackd is not
+        configured or unreachable (caller falls back to subprocess)
+    """
+    if not _BLACKD_URL:
+        return None
+
+    import urllib.request
+    import urllib.error
+
+    try:
+        request = urllib.request.Request(_BLACKD_URL, data=path.read_bytes(), method="POST")
+        with urllib.request.urlopen(request, timeout=5) as response:
+            if response.status == 200:
+                path.write_bytes(response.read())
+                _log("INFO", f"Formatted {path} via blackd")
+                return True
+            if response.status == 204:
+                return True  # Already well formatted
+    except urllib.error.HTTPError as e:
+        _log("WARNING", f"blackd failed for {path}: HTTP {e.code}")
+        return False
+    except Exception as e:
+        _log("DEBUG", f"blackd unreachable, falling back to subprocess: {e}")
+    return None
+
+
 def format_file(file_path: str) -> bool:
     """
     Format file using appropriate formatter.
@@ -46,13 +131,34 @@ def format_file(file_path: str) -> bool:
     if not path.exists():
         return False
 
-    ext = path.suffix.lower()
+    # Suffixes are almost always already lowercase; only pay the
+    # lowercased-copy allocation when the direct lookup misses
+    ext = path.suffix
     formatter = FORMATTERS.get(ext)
+    if formatter is None and ext != (ext_lower := ext.lower()):
+        ext = ext_lower
+        formatter = FORMATTERS.get(ext)
 
     if not formatter:
-        logger.debug(f"No formatter configured for {ext}")
+        _log("DEBUG", f"No formatter configured for {ext}")
         return True  # Not an error, just no formatter
 
+    stat = path.stat()
+    if _load_format_cache().get(str(path)) == [stat.st_mtime_ns, stat.st_size]:
+        _log("DEBUG", f"Unchanged since last format, skipping: {file_path}")
+        return True
+
+    if ext == ".py":
+        blackd_result = _format_with_blackd(path)
+        if blackd_result is not None:
+            if blackd_result:
+                _record_formatted(path)
+            return blackd_result
+
+    # Deferred: only invocations that actually spawn a formatter pay
+    # the subprocess import; early exits above skip it entirely
+    import subprocess
+
     try:
         cmd = formatter + [str(path)]
         result = subprocess.run(
@@ -62,26 +168,27 @@ def format_file(file_path: str) -> bool:
             timeout=30
         )
         if result.returncode == 0:
-            logger.info(f"Formatted {file_path}")
+            _log("INFO", f"Formatted {file_path}")
+            _record_formatted(path)
             return True
         else:
-            logger.warning(f"Formatter failed for {file_path}: {result.stderr}")
+            _log("WARNING", f"Formatter failed for {file_path}: {result.stderr}")
             return False
     except FileNotFoundError:
-        logger.debug(f"Formatter not found for {ext}")
+        _log("DEBUG", f"Formatter not found for {ext}")
         return True  # Formatter not installed, not an error
     except subprocess.TimeoutExpired:
-        logger.warning(f"Formatter timeout for {file_path}")
+        _log("WARNING", f"Formatter timeout for {file_path}")
         return False
     except Exception as e:
-        logger.error(f"Error formatting {file_path}: {e}")
+        _log("ERROR", f"Error formatting {file_path}: {e}")
         return False
 
 
 def main() -> None:
     """Main hook entry point."""
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read(_STDIN_CAP))
         tool_name = input_data.get("tool_name", "")
         tool_input = input_data.get("tool_input", {})
         tool_response = input_data.get("tool_response", {})
@@ -91,7 +198,7 @@ def main() -> None:
 
         # Check if operation was successful
         if not tool_response.get("success", True):
-            logger.debug("Tool operation was not successful, skipping format")
+            _log("DEBUG", "Tool operation was not successful, skipping format")
             sys.exit(0)
 
         if file_path:
@@ -100,10 +207,10 @@ def main() -> None:
         sys.exit(0)
 
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
+        _log("ERROR", f"JSON decode error: {e}")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
+        _log("ERROR", f"Unexpected error: {type(e).__name__}: {e}")
         sys.exit(0)
 
 
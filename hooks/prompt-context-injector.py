@@ -6,45 +6,73 @@ Runs on UserPromptSubmit event.
 """
 
 import json
+import os
+import time
 import sys
-import logging
 import re
 from pathlib import Path
 from datetime import datetime
 
-# Setup logging
+try:
+    import orjson
+    _loads = orjson.loads  # C-backed, 2-5x faster; error subclasses json's
+except ImportError:
+    _loads = json.loads
+
+# Upper bound on stdin; prompts are small relative to this
+_STDIN_CAP = 8 * 1024 * 1024
+
+# Lightweight logger: one O_APPEND fd opened at import, one os.write per
+# record. O_APPEND writes are atomic up to PIPE_BUF so no locking is
+# needed, and the logging module's handler/formatter/lock machinery
+# stays off the hot path entirely.
 LOG_DIR = Path.home() / ".claude" / "hooks" / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
-logging.basicConfig(
-    filename=LOG_DIR / "prompt-context-injector.log",
-    level=logging.DEBUG,
-    format="%(asctime)s - %(levelname)s - %(message)s"
+_LOG_FD = os.open(str(LOG_DIR / "prompt-context-injector.log"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _log(level: str, msg: str) -> None:
+    try:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        os.write(_LOG_FD, f"{timestamp} - {level} - {msg}\n".encode("utf-8", "replace"))
+    except OSError:
+        pass
+
+
+# All trigger phrases fused into one case-insensitive alternation; a
+# single compiled scan replaces five substring passes over a lowered
+# copy of the prompt. "ultrathink" precedes "think" so the longer phrase
+# wins at any given position.
+_TRIGGER_RE = re.compile(
+    r"(?i)(?P<ultra>ultrathink)|(?P<hard>think hard)|(?P<think>think)"
+    r"|(?P<auto>autonomous|handle it)|(?P<sup>step by step|supervise)"
 )
-logger = logging.getLogger(__name__)
 
+_THINKING_INSTRUCTIONS = {
+    "ultra": "Enable extended thinking with maximum depth.",
+    "hard": "Enable extended thinking for this complex problem.",
+    "think": "Apply careful reasoning to this question.",
+}
+
+_AUTONOMY_INSTRUCTIONS = {
+    "auto": "Mode: AUTONOMOUS - Execute end-to-end without checkpoints.",
+    "sup": "Mode: SUPERVISED - Explain each action before executing.",
+}
 
-def detect_thinking_trigger(prompt: str) -> str | None:
-    """Detect extended thinking triggers in prompt."""
-    triggers = {
-        "ultrathink": "Enable extended thinking with maximum depth.",
-        "think hard": "Enable extended thinking for this complex problem.",
-        "think": "Apply careful reasoning to this question.",
-    }
-    prompt_lower = prompt.lower()
-    for trigger, instruction in triggers.items():
-        if trigger in prompt_lower:
-            return instruction
-    return None
 
+def detect_triggers(prompt: str) -> tuple[str | None, str | None]:
+    """
+    Detect thinking and autonomy triggers in one pass over the prompt.
 
-def detect_autonomy_mode(prompt: str) -> str | None:
-    """Detect autonomy mode triggers."""
-    prompt_lower = prompt.lower()
-    if "autonomous" in prompt_lower or "handle it" in prompt_lower:
-        return "Mode: AUTONOMOUS - Execute end-to-end without checkpoints."
-    if "step by step" in prompt_lower or "supervise" in prompt_lower:
-        return "Mode: SUPERVISED - Explain each action before executing."
-    return None
+    Returns:
+        (thinking_instruction, autonomy_instruction), either may be None
+    """
+    seen = {match.lastgroup for match in _TRIGGER_RE.finditer(prompt)}
+    thinking = next(
+        (_THINKING_INSTRUCTIONS[g] for g in ("ultra", "hard", "think") if g in seen), None)
+    autonomy = next(
+        (_AUTONOMY_INSTRUCTIONS[g] for g in ("auto", "sup") if g in seen), None)
+    return thinking, autonomy
 
 
 def get_current_time() -> str:
@@ -55,7 +83,7 @@ def get_current_time() -> str:
 def main() -> None:
     """Main hook entry point."""
     try:
-        input_data = json.load(sys.stdin)
+        input_data = _loads(sys.stdin.buffer.read(_STDIN_CAP))
         prompt = input_data.get("prompt", "")
 
         context_parts = []
@@ -63,17 +91,15 @@ def main() -> None:
         # Add timestamp
         context_parts.append(f"Current time: {get_current_time()}")
 
-        # Check for thinking triggers
-        thinking = detect_thinking_trigger(prompt)
+        # Check for thinking and autonomy triggers (single scan)
+        thinking, autonomy = detect_triggers(prompt)
         if thinking:
             context_parts.append(thinking)
-            logger.info(f"Detected thinking trigger: {thinking}")
+            _log("INFO", f"Detected thinking trigger: {thinking}")
 
-        # Check for autonomy mode
-        autonomy = detect_autonomy_mode(prompt)
         if autonomy:
             context_parts.append(autonomy)
-            logger.info(f"Detected autonomy mode: {autonomy}")
+            _log("INFO", f"Detected autonomy mode: {autonomy}")
 
         if context_parts:
             additional_context = "\n".join(context_parts)
@@ -84,15 +110,15 @@ def main() -> None:
                 }
             }
             print(json.dumps(output))
-            logger.info("Context injected successfully")
+            _log("INFO", "Context injected successfully")
 
         sys.exit(0)
 
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
+        _log("ERROR", f"JSON decode error: {e}")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
+        _log("ERROR", f"Unexpected error: {type(e).__name__}: {e}")
         sys.exit(0)
 
 
@@ -23,21 +23,29 @@ RED_FLAGS = [
     r"done[.!]?\s*$",                  # Just "done" with nothing else
 ]
 
+# Both sets fused into one alternation so a single scan classifies the
+# output; group prefix ('r'/'i') says which set an occurrence belongs to
+_QUAL_RE = re.compile(
+    "|".join([f"(?P<r{i}>{p})" for i, p in enumerate(RED_FLAGS)]
+             + [f"(?P<i{i}>{p})" for i, p in enumerate(QUALITY_INDICATORS)]),
+    re.IGNORECASE
+)
+
 def check_quality(output: str) -> tuple[bool, str]:
     """Check if output meets quality standards."""
     if len(output) < 50:
         return False, "Output too brief - provide more detail"
 
-    # Check for red flags
-    for flag in RED_FLAGS:
-        if re.search(flag, output, re.IGNORECASE):
+    # One pass over the output finds red flags and quality indicators
+    # together. Keep scanning past indicators: a red flag anywhere in
+    # the output still fails the check, as with the separate passes.
+    has_indicator = False
+    for match in _QUAL_RE.finditer(output):
+        if match.lastgroup[0] == "r":
             return False, f"Contains uncertain language - provide evidence"
+        has_indicator = True
 
-    # Check for quality indicators
-    indicator_count = sum(1 for ind in QUALITY_INDICATORS
-                         if re.search(ind, output, re.IGNORECASE))
-
-    if indicator_count < 1:
+    if not has_indicator:
         return False, "Missing evidence of work - show output/results"
 
     return True, ""
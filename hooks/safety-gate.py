@@ -8,24 +8,40 @@ import json
 import sys
 import re
 
-# Dangerous patterns to block
+# Dangerous patterns to block (compiled once at import).
+# Negated character classes instead of unbounded .* keep worst-case
+# matching linear - no catastrophic backtracking on crafted commands.
+# Ordered cheapest-rejection first: fixed literal prefixes before
+# patterns with quantified gaps, so non-matches bail out early.
+# is_dangerous matches the lowered command with no IGNORECASE, so the
+# engine skips per-char case folding - pattern sources MUST be all
+# lowercase, or they can never match.
 BLOCK_PATTERNS = [
-    r"rm\s+-rf\s+[/~]",           # rm -rf / or ~
-    r"rm\s+-rf\s+\.\s*$",          # rm -rf .
-    r":(){ :|:& };:",              # Fork bomb
-    r"mkfs\.",                     # Format filesystem
-    r"dd\s+if=.*of=/dev/",         # Overwrite disk
-    r">\s*/dev/sd[a-z]",           # Redirect to disk
-    r"chmod\s+-R\s+777\s+/",       # Dangerous permissions
-    r"curl.*\|\s*(ba)?sh",         # Pipe curl to shell
-    r"wget.*\|\s*(ba)?sh",         # Pipe wget to shell
+    re.compile(p) for p in [
+        r":(){ :|:& };:",              # Fork bomb
+        r"mkfs\.",                     # Format filesystem
+        r"chmod\s+-r\s+777\s+/",       # Dangerous permissions
+        r">\s*/dev/sd[a-z]",           # Redirect to disk
+        r"rm\s+-rf\s+[/~]",           # rm -rf / or ~
+        r"rm\s+-rf\s+\.\s*$",          # rm -rf .
+        r"dd\s+if=[^;&]*of=/dev/",     # Overwrite disk
+        r"curl[^;&]*\|\s*(?:ba)?sh",   # Pipe curl to shell
+        r"wget[^;&]*\|\s*(?:ba)?sh",   # Pipe wget to shell
+    ]
 ]
 
+# Fast prescreen: every block pattern requires one of these literal
+# substrings, so benign commands skip the regex pass entirely.
+_REQUIRED_LITERALS = ("rm", "mkfs", "dd", "/dev/", "chmod", "curl", "wget", ":(")
+
 def is_dangerous(command: str) -> tuple[bool, str]:
     """Check if command matches dangerous patterns."""
+    cmd_lower = command.lower()
+    if not any(literal in cmd_lower for literal in _REQUIRED_LITERALS):
+        return False, ""
     for pattern in BLOCK_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return True, f"Blocked: matches dangerous pattern '{pattern}'"
+        if pattern.search(cmd_lower):
+            return True, f"Blocked: matches dangerous pattern '{pattern.pattern}'"
     return False, ""
 
 def main():
@@ -6,9 +6,11 @@ Runs on SessionStart event.
 """
 
 import json
+import os
 import sys
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -41,19 +43,28 @@ def load_previous_session() -> Optional[Dict[str, Any]]:
         if not memory_path.exists():
             return None
 
-        # Find most recent session file
-        session_files = sorted(memory_path.glob("session_*.json"), reverse=True)
-        if not session_files:
+        # Find most recent session file. Archive names embed a sortable
+        # timestamp (session_YYYYMMDD_HHMMSS_xxxx.json), so the
+        # lexicographic max is the newest - one scandir pass tracks it
+        # without materializing and sorting every Path in the directory.
+        latest_name = None
+        with os.scandir(memory_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.startswith("session_") and name.endswith(".json")
+                        and (latest_name is None or name > latest_name)):
+                    latest_name = name
+        if latest_name is None:
             return None
 
-        latest_session = session_files[0]
+        latest_session = memory_path / latest_name
         with open(latest_session, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            logger.info(f"Loaded previous session from: {latest_session}")
+            logger.info("Loaded previous session from: %s", latest_session)
             return data
 
     except Exception as e:
-        logger.error(f"Error loading previous session: {type(e).__name__}: {e}")
+        logger.error("Error loading previous session: %s: %s", type(e).__name__, e)
         return None
 
 
@@ -69,40 +80,59 @@ def load_progress_file() -> Optional[str]:
         if not progress_file.exists():
             return None
 
-        with open(progress_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            # Get last 20 lines
-            recent_lines = lines[-20:] if len(lines) > 20 else lines
-            progress_text = ''.join(recent_lines).strip()
-            logger.info(f"Loaded progress file: {len(recent_lines)} recent lines")
-            return progress_text
+        # The file grows without bound, but only the last 20 lines
+        # matter: seek to a 4KB tail window instead of materializing
+        # every line via readlines(). errors='replace' absorbs a
+        # multi-byte character split at the window boundary.
+        size = progress_file.stat().st_size
+        with open(progress_file, 'rb') as f:
+            f.seek(max(0, size - 4096))
+            tail = f.read()
+
+        recent_lines = tail.decode('utf-8', errors='replace').splitlines()[-20:]
+        progress_text = '\n'.join(recent_lines).strip()
+        logger.info("Loaded progress file: %s recent lines", len(recent_lines))
+        return progress_text
 
     except Exception as e:
-        logger.error(f"Error loading progress file: {type(e).__name__}: {e}")
+        logger.error("Error loading progress file: %s: %s", type(e).__name__, e)
         return None
 
 
 def get_git_branch() -> Optional[str]:
     """
-    Get current git branch name.
+    Get current git branch name by reading .git/HEAD directly.
+
+    Reading the ref file costs one small file read instead of a git
+    fork/exec (15-50ms), leaving a single git subprocess on the
+    SessionStart critical path. Worktree gitdir pointers are followed.
 
     Returns:
         Branch name or None if not in git repo
     """
     try:
-        result = subprocess.run(
-            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            logger.info(f"Current git branch: {branch}")
+        for directory in [Path.cwd(), *Path.cwd().parents]:
+            git_path = directory / ".git"
+            if not git_path.exists():
+                continue
+            if git_path.is_file():
+                # Worktree/submodule: .git is a pointer to the real dir
+                gitdir = git_path.read_text(encoding='utf-8').strip()
+                if not gitdir.startswith("gitdir:"):
+                    return None
+                git_path = Path(gitdir[7:].strip())
+                if not git_path.is_absolute():
+                    git_path = directory / git_path
+            head = (git_path / "HEAD").read_text(encoding='utf-8').strip()
+            if head.startswith("ref: refs/heads/"):
+                branch = head[len("ref: refs/heads/"):]
+            else:
+                branch = "HEAD"  # Detached, matches rev-parse --abbrev-ref
+            logger.info("Current git branch: %s", branch)
             return branch
         return None
     except Exception as e:
-        logger.debug(f"Error getting git branch: {type(e).__name__}: {e}")
+        logger.debug("Error getting git branch: %s: %s", type(e).__name__, e)
         return None
 
 
@@ -126,11 +156,11 @@ def get_recent_commits(limit: int = 5) -> Optional[List[str]]:
         if result.returncode == 0:
             commits = result.stdout.strip().split('\n')
             commits = [c.strip() for c in commits if c.strip()]
-            logger.info(f"Retrieved {len(commits)} recent commits")
+            logger.info("Retrieved %s recent commits", len(commits))
             return commits
         return None
     except Exception as e:
-        logger.debug(f"Error getting recent commits: {type(e).__name__}: {e}")
+        logger.debug("Error getting recent commits: %s: %s", type(e).__name__, e)
         return None
 
 
@@ -148,17 +178,28 @@ def build_context_summary() -> Dict[str, Any]:
         "progress": None
     }
 
+    # The four loaders are independent and I/O-bound (subprocess, disk
+    # reads), so run them concurrently: wall time becomes the slowest
+    # single operation instead of the sum of all four.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        branch_f = pool.submit(get_git_branch)
+        commits_f = pool.submit(get_recent_commits, 5)
+        previous_f = pool.submit(load_previous_session)
+        progress_f = pool.submit(load_progress_file)
+
+        branch = branch_f.result()
+        commits = commits_f.result()
+        previous = previous_f.result()
+        progress = progress_f.result()
+
     # Add git context
-    branch = get_git_branch()
     if branch:
         summary["git"]["current_branch"] = branch
 
-    commits = get_recent_commits(5)
     if commits:
         summary["git"]["recent_commits"] = commits
 
     # Add previous session info
-    previous = load_previous_session()
     if previous:
         summary["previous_session"] = {
             "session_id": previous.get("session_id"),
@@ -169,7 +210,6 @@ def build_context_summary() -> Dict[str, Any]:
         }
 
     # Add progress file
-    progress = load_progress_file()
     if progress:
         summary["progress"] = progress
 
@@ -225,10 +265,10 @@ def main() -> None:
         sys.exit(0)
 
     except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
+        logger.error("JSON decode error: %s", e)
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}: {e}")
+        logger.error("Unexpected error: %s: %s", type(e).__name__, e)
         sys.exit(0)
 
 
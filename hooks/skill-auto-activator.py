@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Skill Auto-Activator Hook for Claude Code.
+Suggests a relevant superpowers skill based on the user's prompt.
+Runs on UserPromptSubmit event.
+"""
+
+import json
+import os
+import time
+import sys
+import re
+from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+    _loads = orjson.loads  # C-backed, 2-5x faster; error subclasses json's
+except ImportError:
+    _loads = json.loads
+
+# Upper bound on stdin; prompts are small relative to this
+_STDIN_CAP = 8 * 1024 * 1024
+
+# Lightweight logger: one O_APPEND fd opened at import, one os.write per
+# record. O_APPEND writes are atomic up to PIPE_BUF so no locking is
+# needed, and the logging module's handler/formatter/lock machinery
+# stays off the hot path entirely.
+LOG_DIR = Path.home() / ".claude" / "hooks" / "logs"
+LOG_DIR.mkdir(parents=True, exist_ok=True)
+_LOG_FD = os.open(str(LOG_DIR / "skill-auto-activator.log"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _log(level: str, msg: str) -> None:
+    try:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        os.write(_LOG_FD, f"{timestamp} - {level} - {msg}\n".encode("utf-8", "replace"))
+    except OSError:
+        pass
+
+
+# Skill patterns in priority order. Debugging outranks everything: a
+# prompt about an error in tests should trigger the debugging skill,
+# not TDD. Pattern sources are lowercase and suggest_skill matches the
+# lowered prompt, so no IGNORECASE flag. Bare "test" is deliberately
+# not a keyword - it appears in far too many prompts that aren't about
+# writing tests.
+SKILL_PATTERNS = [
+    ("superpowers:systematic-debugging",
+     r"\b(?:bug|error|debug|traceback|exception|crash|broken|failing)"),
+    ("superpowers:brainstorming",
+     r"\bbrainstorm"),
+    ("superpowers:test-driven-development",
+     r"\b(?:implement|unit\s+tests?|write\s+tests?|new\s+feature|tdd\b)"),
+    ("superpowers:requesting-code-review",
+     r"\breview"),
+    ("superpowers:verification-before-completion",
+     r"\b(?:done|complete|finished|merge|ship\s+it)\b"),
+]
+
+# All skill keywords fused into one alternation so a single linear scan
+# of the prompt finds every category at once, instead of one pass per
+# skill. Inner groups are non-capturing, so match.lastgroup always names
+# the category that matched.
+_SKILL_RE = re.compile(
+    "|".join(f"(?P<s{i}>{p})" for i, (_, p) in enumerate(SKILL_PATTERNS))
+)
+_GROUP_PRIORITY = [(f"s{i}", skill) for i, (skill, _) in enumerate(SKILL_PATTERNS)]
+
+
+def safe_get_string(data: dict, key: str, default: str = "") -> str:
+    """Safely extract string value from dict."""
+    value = data.get(key, default)
+    if value is None:
+        return default
+    return str(value)[:10000]  # Limit length
+
+
+def suggest_skill(prompt: str) -> Optional[str]:
+    """
+    Suggest the highest-priority skill whose keywords appear in the prompt.
+
+    Args:
+        prompt: Raw user prompt text
+
+    Returns:
+        Skill identifier, or None if no keywords match
+    """
+    if not prompt:
+        return None
+
+    # A skill keyword that matters appears in the first few KB if it
+    # appears at all; capping before lower()+match bounds the work on
+    # pathological inputs to a constant instead of linear in the prompt
+    prompt_lower = prompt[:8192].lower()
+
+    # One scan collects every category present; priority (not position
+    # in the prompt) then picks the winner
+    seen = {match.lastgroup for match in _SKILL_RE.finditer(prompt_lower)}
+    if seen:
+        for group, skill in _GROUP_PRIORITY:
+            if group in seen:
+                return skill
+    return None
+
+
+def main() -> None:
+    """Main hook entry point."""
+    try:
+        input_data = _loads(sys.stdin.buffer.read(_STDIN_CAP))
+        prompt = safe_get_string(input_data, "prompt")
+
+        skill = suggest_skill(prompt)
+        if skill:
+            _log("INFO", f"Suggesting skill: {skill}")
+            output = {
+                "hookSpecificOutput": {
+                    "hookEventName": "UserPromptSubmit",
+                    "additionalContext": f"Consider using the {skill} skill for this task."
+                }
+            }
+            print(json.dumps(output))
+
+        sys.exit(0)
+
+    except json.JSONDecodeError as e:
+        _log("ERROR", f"JSON decode error: {e}")
+        sys.exit(0)
+    except Exception as e:
+        _log("ERROR", f"Unexpected error: {type(e).__name__}: {e}")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
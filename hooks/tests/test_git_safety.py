@@ -9,7 +9,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-@pytest.fixture
+# Session-scoped: the module is stateless, so one exec_module serves
+# every test instead of re-parsing the hook per test
+@pytest.fixture(scope="session")
 def git_safety():
     """Import the git safety module."""
     import importlib.util
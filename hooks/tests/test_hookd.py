@@ -0,0 +1,56 @@
+"""
+Tests for hookd dispatch.
+"""
+
+import json
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Session-scoped: the module is stateless, so one exec_module serves
+# every test instead of re-parsing the hook per test
+@pytest.fixture(scope="session")
+def hookd():
+    """Import the hookd module."""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(
+        "hookd",
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), "hookd.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestDispatch:
+    """Test in-process hook dispatch."""
+
+    def test_dispatches_binary_stdin_hook(self, hookd):
+        """Hooks that read sys.stdin.buffer must see the payload."""
+        payload = json.dumps({
+            "tool_name": "Write",
+            "tool_input": {"file_path": ".env"},
+        })
+        output = hookd._dispatch("git-safety-net", payload)
+        response = json.loads(output)
+        assert response["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_dispatches_text_stdin_hook(self, hookd):
+        """Hooks that read text-mode stdin keep working."""
+        payload = json.dumps({
+            "tool_input": {"command": "rm -rf /"},
+        })
+        output = hookd._dispatch("bash-safety-gate", payload)
+        response = json.loads(output)
+        assert response["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+    def test_allows_benign_input(self, hookd):
+        """A benign payload produces no output."""
+        payload = json.dumps({
+            "tool_name": "Write",
+            "tool_input": {"file_path": "notes.md"},
+        })
+        assert hookd._dispatch("git-safety-net", payload) == ""
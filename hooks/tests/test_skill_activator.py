@@ -13,7 +13,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from importlib import import_module
 
 
-@pytest.fixture
+# Session-scoped: the module is stateless, so one exec_module serves
+# every test instead of re-parsing the hook per test
+@pytest.fixture(scope="session")
 def skill_activator():
     """Import the skill activator module."""
     # Use importlib to handle the hyphenated filename